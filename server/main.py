@@ -3,8 +3,10 @@
 import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 from typing import List, Optional, Union
 
+import anyio
 from fastmcp import FastMCP
 
 # Add lib directory to path for bundled dependencies
@@ -36,8 +38,21 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Close the shared WMS client's connection pool on shutdown"""
+    global wms_client
+    try:
+        yield
+    finally:
+        if wms_client is not None:
+            await wms_client.aclose()
+            wms_client = None
+
+
 # Initialize MCP server
-mcp = FastMCP("BGS Soil Data WMS")
+mcp = FastMCP("BGS Soil Data WMS", lifespan=lifespan)
 
 
 class GetMapRequest(BaseModel):
@@ -80,6 +95,31 @@ class ConvertCoordinatesRequest(BaseModel):
     target_crs: str = Field(..., description="Target coordinate reference system")
 
 
+# Static summary returned by get_soil_data_summary, built once at import
+_SOIL_DATA_SUMMARY = {
+    "soil_data_types": {
+        "topsoil": "Top soil sample data and properties",
+        "profile_soil": "Profile soil sample data from different depths",
+        "soil_texture": "Soil texture classification and properties",
+        "soil_depth": "Soil depth measurements from boreholes",
+        "parent_material": "Soil parent material grain size and composition"
+    },
+    "coordinate_systems": {
+        "EPSG:4326": "WGS84 Latitude/Longitude",
+        "EPSG:27700": "British National Grid (BNG)",
+        "EPSG:3857": "Web Mercator"
+    },
+    "common_workflows": [
+        "1. Use list_layers() to discover available soil data layers",
+        "2. Use describe_layer() to get details about specific layers",
+        "3. Use get_map() to generate map images for visualization",
+        "4. Use get_feature_info() to get detailed information at specific locations",
+        "5. Use convert_coordinates() to work with different coordinate systems"
+    ],
+    "service_url": "https://map.bgs.ac.uk/arcgis/services/UKSO/UKSO_BGS/MapServer/WMSServer"
+}
+
+
 # Global WMS client instance
 wms_client = None
 
@@ -117,7 +157,7 @@ async def get_soil_map_url(request: GetMapRequest) -> str:
             crs=request.crs
         )
         
-        return await client.get_map(
+        return client.get_map(
             layers=request.layers,
             bbox=bbox,
             width=request.width,
@@ -188,12 +228,23 @@ async def get_soil_layer_info(layer_name: str) -> dict:
         raise
 
 
+@mcp.tool()
+async def get_soil_layers_info(layer_names: Optional[List[str]] = None) -> dict:
+    """Get detailed information about several soil data layers in one call (all layers if no names are given)"""
+    client = await get_wms_client()
+    try:
+        return await client.get_layers_by_name(layer_names)
+    except Exception as e:
+        logger.error(f"Error describing layers: {e}")
+        raise
+
+
 @mcp.tool()
 async def convert_coordinates(request: ConvertCoordinatesRequest) -> dict:
     """Convert coordinates between different coordinate reference systems"""
     client = await get_wms_client()
     try:
-        x, y = await client.convert_coordinates(
+        x, y = client.convert_coordinates(
             request.x, 
             request.y, 
             request.source_crs, 
@@ -220,34 +271,19 @@ async def convert_coordinates(request: ConvertCoordinatesRequest) -> dict:
 @mcp.tool()
 async def get_soil_data_summary() -> dict:
     """Get a summary of available soil data types and their descriptions"""
-    return {
-        "soil_data_types": {
-            "topsoil": "Top soil sample data and properties",
-            "profile_soil": "Profile soil sample data from different depths",
-            "soil_texture": "Soil texture classification and properties",
-            "soil_depth": "Soil depth measurements from boreholes",
-            "parent_material": "Soil parent material grain size and composition"
-        },
-        "coordinate_systems": {
-            "EPSG:4326": "WGS84 Latitude/Longitude",
-            "EPSG:27700": "British National Grid (BNG)",
-            "EPSG:3857": "Web Mercator"
-        },
-        "common_workflows": [
-            "1. Use list_layers() to discover available soil data layers",
-            "2. Use describe_layer() to get details about specific layers",
-            "3. Use get_map() to generate map images for visualization",
-            "4. Use get_feature_info() to get detailed information at specific locations",
-            "5. Use convert_coordinates() to work with different coordinate systems"
-        ],
-        "service_url": "https://map.bgs.ac.uk/arcgis/services/UKSO/UKSO_BGS/MapServer/WMSServer"
-    }
+    return _SOIL_DATA_SUMMARY
 
 
 def main():
     """Main entry point for the MCP server"""
     try:
-        mcp.run()
+        # Use uvloop's faster event loop when it is installed (not available on Windows)
+        try:
+            import uvloop  # noqa: F401
+        except ImportError:
+            mcp.run()
+        else:
+            anyio.run(mcp.run_async, backend_options={"use_uvloop": True})
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
@@ -1,18 +1,283 @@
 """WMS client utilities for BGS soil data service"""
 
 import asyncio
+import concurrent.futures
+import functools
 import logging
-import urllib.request
+import sys
+import time
 import urllib.parse
-import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Union
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+try:
+    import lxml.etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
 
 logger = logging.getLogger(__name__)
 
+_NAMESPACES = {
+    'wms': 'http://www.opengis.net/wms',
+    'xlink': 'http://www.w3.org/1999/xlink'
+}
+
+_WMS_LAYER = '{http://www.opengis.net/wms}Layer'
+_WMS_SERVICE = '{http://www.opengis.net/wms}Service'
+_WMS_GET_MAP = '{http://www.opengis.net/wms}GetMap'
+_WMS_GET_FEATURE_INFO = '{http://www.opengis.net/wms}GetFeatureInfo'
+
+
+if HAS_LXML:
+    def _compile_path(path: str):
+        """Compile a relative path once instead of on every lookup"""
+        return ET.XPath(path, namespaces=_NAMESPACES)
+else:
+    def _compile_path(path: str):
+        """Bind a relative path for ElementTree, which has no XPath class"""
+        return lambda elem: elem.findall(path, _NAMESPACES)
+
+
+_XP_NAME = _compile_path('wms:Name')
+_XP_TITLE = _compile_path('wms:Title')
+_XP_ABSTRACT = _compile_path('wms:Abstract')
+_XP_CRS = _compile_path('wms:CRS')
+_XP_FORMAT = _compile_path('wms:Format')
+
+
+def _first(path, elem):
+    """Return the first element matched by a compiled path, or None"""
+    matches = path(elem)
+    return matches[0] if matches else None
+
+
+def _new_capabilities_parser():
+    """Create a pull parser reporting the elements _CapabilitiesParser consumes"""
+    if HAS_LXML:
+        # Never resolve entities or touch the network while parsing remote documents
+        return ET.XMLPullParser(
+            events=('start', 'end'),
+            tag=(_WMS_LAYER, _WMS_SERVICE, _WMS_GET_MAP, _WMS_GET_FEATURE_INFO),
+            resolve_entities=False,
+            no_network=True
+        )
+    return ET.XMLPullParser(events=('start', 'end'))
+
+
+# Very rough conversions between common CRS (for demo purposes only).
+# In production, use proper transformation libraries such as pyproj.
+_METRES_PER_DEGREE = 111319.9
+
+_CRS_TRANSFORMS: Dict[Tuple[str, str], Callable[[float, float], Tuple[float, float]]] = {
+    # WGS84 to BNG
+    ("EPSG:4326", "EPSG:27700"): lambda x, y: (x * _METRES_PER_DEGREE, y * _METRES_PER_DEGREE),
+    # BNG to WGS84
+    ("EPSG:27700", "EPSG:4326"): lambda x, y: (x / _METRES_PER_DEGREE, y / _METRES_PER_DEGREE),
+}
+
+
+# Name of the CRS parameter for each WMS version (1.3.0 renamed SRS to CRS)
+_CRS_PARAM = {
+    "1.3.0": "crs",
+    "1.1.1": "srs",
+    "1.1.0": "srs",
+    "1.0.0": "srs"
+}
+
+
+def _encode_static_query(request: str, version: str) -> str:
+    """Encode the service/request/version part of a query string"""
+    return urllib.parse.urlencode({
+        "service": "WMS",
+        "request": request,
+        "version": version
+    })
+
+
+# Query-string prefix for every known (request, version) pair, encoded once
+_STATIC_QUERY: Dict[Tuple[str, str], str] = {
+    (request, version): _encode_static_query(request, version)
+    for request in ("GetCapabilities", "GetMap", "GetFeatureInfo")
+    for version in _CRS_PARAM
+}
+
+
+def _static_query(request: str, version: str) -> str:
+    """Return the encoded "service=WMS&request=...&version=..." prefix"""
+    query = _STATIC_QUERY.get((request, version))
+    if query is None:
+        # Caller-supplied versions are free-form; don't grow the table with them
+        query = _encode_static_query(request, version)
+    return query
+
+
+# URL construction is pure templating, so identical requests (an agent
+# re-asking for the same view) are served from an LRU cache. Only the URL
+# is cached, never a response. The cache is typed because 1, 1.0 and True
+# compare equal but format differently in the URL; the bbox is passed
+# pre-formatted because typing does not reach inside a tuple.
+@functools.lru_cache(maxsize=1024, typed=True)
+def _build_get_map_url(
+    base_url: str,
+    layers: str,
+    bbox: str,
+    width: int,
+    height: int,
+    format: str,
+    version: str,
+    crs: str,
+    transparent: bool,
+    bgcolor: str
+) -> str:
+    """Build a GetMap request URL"""
+    params = {
+        "layers": layers,
+        "width": width,
+        "height": height,
+        "format": format,
+        "transparent": str(transparent).lower(),
+        "bgcolor": bgcolor
+    }
+    
+    params[_CRS_PARAM.get(version, "srs")] = crs
+    params["bbox"] = bbox
+        
+    return f"{base_url}?{_static_query('GetMap', version)}&{urllib.parse.urlencode(params)}"
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _build_get_feature_info_url(
+    base_url: str,
+    layers: str,
+    bbox: str,
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+    info_format: str,
+    version: str,
+    crs: str,
+    feature_count: int
+) -> str:
+    """Build a GetFeatureInfo request URL"""
+    params = {
+        "layers": layers,
+        "query_layers": layers,
+        "width": width,
+        "height": height,
+        "info_format": info_format,
+        "feature_count": feature_count,
+        "x": x,
+        "y": y
+    }
+    
+    params[_CRS_PARAM.get(version, "srs")] = crs
+    params["bbox"] = bbox
+        
+    return f"{base_url}?{_static_query('GetFeatureInfo', version)}&{urllib.parse.urlencode(params)}"
+
+
+# Every streamed capabilities parse runs on this one thread
+_PARSE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="wms-capabilities"
+)
+
+
+class _CapabilitiesParser:
+    """Incremental WMS capabilities parser
+    
+    Chunks of the document are fed in as they arrive. Each Service, GetMap,
+    GetFeatureInfo and Layer element is emptied once it has been read, and
+    with lxml already-parsed sibling Layer elements are detached as well, so
+    a large layer list does not accumulate in memory. The rest of the
+    document (request metadata, emptied elements whose siblings are not
+    layers) stays in the tree; under the ElementTree fallback no elements
+    are detached at all.
+    """
+    
+    def __init__(self, version: str, parse_layer: Callable[..., Optional[dict]]):
+        self._version = version
+        self._parse_layer = parse_layer
+        self._parser = _new_capabilities_parser()
+        self._title = "BGS Soil Data WMS"
+        self._abstract = None
+        self._service_seen = False
+        self._formats: List[str] = []
+        self._info_formats: List[str] = []
+        # Layers are nested, and a parent's end event arrives after its
+        # children's; reserve each layer's slot on its start event so the
+        # result keeps document order
+        self._layers: List[Optional[dict]] = []
+        self._open_layers: List[int] = []
+        
+    def feed(self, data: bytes) -> None:
+        """Parse the next chunk of the document"""
+        self._parser.feed(data)
+        self._consume_events()
+        
+    def close(self) -> dict:
+        """Finish parsing and return the capabilities dict"""
+        self._parser.close()
+        self._consume_events()
+        
+        return {
+            "title": self._title,
+            "abstract": self._abstract,
+            "version": self._version,
+            "layers": [layer for layer in self._layers if layer is not None],
+            "formats": self._formats,
+            "info_formats": self._info_formats,
+            "cached_at": datetime.now().isoformat()
+        }
+        
+    def _consume_events(self) -> None:
+        for event, elem in self._parser.read_events():
+            tag = elem.tag
+            if event == 'start':
+                if tag == _WMS_LAYER:
+                    self._open_layers.append(len(self._layers))
+                    self._layers.append(None)
+                continue
+                
+            if tag == _WMS_LAYER:
+                # Unnamed (purely grouping) layers parse to None and leave
+                # their slot empty
+                self._layers[self._open_layers.pop()] = self._parse_layer(elem)
+            elif tag == _WMS_SERVICE and not self._service_seen:
+                self._service_seen = True
+                title_elem = _first(_XP_TITLE, elem)
+                if title_elem is not None:
+                    self._title = title_elem.text
+                    
+                abstract_elem = _first(_XP_ABSTRACT, elem)
+                if abstract_elem is not None:
+                    self._abstract = abstract_elem.text
+            elif tag == _WMS_GET_MAP:
+                self._formats.extend(fmt.text for fmt in _XP_FORMAT(elem) if fmt.text)
+            elif tag == _WMS_GET_FEATURE_INFO:
+                self._info_formats.extend(fmt.text for fmt in _XP_FORMAT(elem) if fmt.text)
+            else:
+                continue
+                
+            elem.clear()
+            if HAS_LXML and tag == _WMS_LAYER:
+                # Earlier sibling layers have already been parsed; detaching
+                # them never touches the parent's own Name/Title/CRS
+                parent = elem.getparent()
+                previous = elem.getprevious()
+                while previous is not None and previous.tag == _WMS_LAYER:
+                    parent.remove(previous)
+                    previous = elem.getprevious()
+
 
 class BoundingBox:
     """Bounding box for WMS requests"""
+    __slots__ = ('min_x', 'min_y', 'max_x', 'max_y', 'crs')
+    
     def __init__(self, min_x: float, min_y: float, max_x: float, max_y: float, crs: str = "EPSG:4326"):
         self.min_x = min_x
         self.min_y = min_y
@@ -26,117 +291,181 @@ class WMSClient:
     
     def __init__(self, base_url: str = "https://map.bgs.ac.uk/arcgis/services/UKSO/UKSO_BGS/MapServer/WMSServer"):
         self.base_url = base_url
-        self._capabilities_cache = None
-        self._cache_timestamp = None
-        self._cache_duration = timedelta(hours=1)
+        # version -> (expiry, etag, last_modified, capabilities)
+        self._capabilities_cache: Dict[str, Tuple[float, Optional[str], Optional[str], dict]] = {}
+        # version -> {layer name: layer}, rebuilt whenever a new document is parsed
+        self._layer_index: Dict[str, Dict[str, dict]] = {}
+        # version -> [(lowercased "name\0title\0abstract", layer)] for search_layers
+        self._search_index: Dict[str, List[Tuple[str, dict]]] = {}
+        # version -> refresh task shared by every caller waiting on it
+        self._pending_refreshes: Dict[str, asyncio.Task] = {}
+        self._cache_duration = 3600.0  # seconds
+        # Pooled keep-alive connections shared by every request this client makes
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            timeout=30.0,
+            follow_redirects=True
+        )
+        # Bound the number of requests in flight against the BGS service
+        self._request_slots = asyncio.Semaphore(8)
+        
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool"""
+        await self._http.aclose()
+        
+    async def _get(self, url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """Issue a GET on the shared pool, waiting for a free request slot"""
+        async with self._request_slots:
+            return await self._http.get(url, headers=headers)
         
     async def get_capabilities(self, version: str = "1.3.0", force_refresh: bool = False) -> dict:
-        """Get WMS service capabilities"""
-        if (not force_refresh and 
-            self._capabilities_cache and 
-            self._cache_timestamp and
-            datetime.now() - self._cache_timestamp < self._cache_duration):
-            return self._capabilities_cache
-            
-        params = {
-            "service": "WMS",
-            "request": "GetCapabilities",
-            "version": version
-        }
+        """Get WMS service capabilities
         
-        url = f"{self.base_url}?{urllib.parse.urlencode(params)}"
+        Parsed capabilities are cached per version. Once an entry expires it
+        is revalidated with a conditional GET, so an unchanged document is
+        not downloaded or parsed again. Concurrent callers that miss the
+        cache share a single in-flight refresh.
+        """
+        entry = self._capabilities_cache.get(version)
+        if not force_refresh and entry and time.monotonic() < entry[0]:
+            return entry[3]
+            
+        # No await between the check and the store, so only one refresh
+        # per version can be started on the event loop
+        refresh = self._pending_refreshes.get(version)
+        if refresh is None:
+            refresh = asyncio.ensure_future(self._refresh_capabilities(version, entry, force_refresh))
+            self._pending_refreshes[version] = refresh
+            refresh.add_done_callback(lambda _: self._pending_refreshes.pop(version, None))
+            
+        # Shield so a cancelled caller doesn't cancel the refresh for the others
+        return await asyncio.shield(refresh)
         
+    async def _refresh_capabilities(
+        self,
+        version: str,
+        entry: Optional[Tuple[float, Optional[str], Optional[str], dict]],
+        force_refresh: bool
+    ) -> dict:
+        """Fetch (or revalidate) capabilities and store them in the cache"""
+        etag = last_modified = None
+        if entry and not force_refresh:
+            etag, last_modified = entry[1], entry[2]
+            
         try:
-            with urllib.request.urlopen(url) as response:
-                content = response.read()
+            capabilities, etag, last_modified = await self._fetch_capabilities(version, etag, last_modified)
+            
+            if capabilities is None:
+                # 304 Not Modified - keep the parsed document we already have
+                capabilities = entry[3]
+            else:
+                self._layer_index[version] = self._index_layers(capabilities["layers"])
+                self._search_index[version] = self._build_search_index(capabilities["layers"])
                 
-            capabilities = self._parse_capabilities(content, version)
-            self._capabilities_cache = capabilities
-            self._cache_timestamp = datetime.now()
+            expiry = time.monotonic() + self._cache_duration
+            self._capabilities_cache[version] = (expiry, etag, last_modified, capabilities)
             return capabilities
             
         except Exception as e:
             logger.error(f"Error getting capabilities: {e}")
             raise
-        
-    def _parse_capabilities(self, xml_content: bytes, version: str) -> dict:
-        """Parse WMS capabilities XML"""
-        try:
-            root = ET.fromstring(xml_content)
-            
-            # Handle namespaces
-            namespaces = {
-                'wms': 'http://www.opengis.net/wms',
-                'xlink': 'http://www.w3.org/1999/xlink'
-            }
-            
-            # Service information
-            service_elem = root.find('.//wms:Service', namespaces)
-            title = "BGS Soil Data WMS"
-            abstract = None
             
-            if service_elem is not None:
-                title_elem = service_elem.find('wms:Title', namespaces)
-                if title_elem is not None:
-                    title = title_elem.text
-                    
-                abstract_elem = service_elem.find('wms:Abstract', namespaces)
-                if abstract_elem is not None:
-                    abstract = abstract_elem.text
+    @staticmethod
+    def _index_layers(layers: List[dict]) -> Dict[str, dict]:
+        """Map layer names to layers, keeping the first layer for a repeated name"""
+        index = {}
+        for layer in layers:
+            index.setdefault(layer.get('name'), layer)
+        return index
+        
+    @staticmethod
+    def _build_search_index(layers: List[dict]) -> List[Tuple[str, dict]]:
+        """Lowercase the searchable fields of every layer once, at parse time
+        
+        The fields are joined with NUL so a single substring test covers
+        name, title and abstract without a match spanning two of them.
+        """
+        return [
+            (
+                "\0".join((
+                    layer.get('name') or '',
+                    layer.get('title') or '',
+                    layer.get('abstract') or ''
+                )).lower(),
+                layer
+            )
+            for layer in layers
+        ]
+        
+    async def _fetch_capabilities(
+        self,
+        version: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> Tuple[Optional[dict], Optional[str], Optional[str]]:
+        """Fetch and parse the capabilities document, returning None on 304
+        
+        The body is fed to the parser chunk by chunk as it is downloaded, so
+        parsing overlaps the transfer and the raw document is never held in
+        memory as a whole.
+        """
+        url = f"{self.base_url}?{_static_query('GetCapabilities', version)}"
+        
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
             
-            # Supported formats
-            formats = []
-            format_elems = root.findall('.//wms:GetMap/wms:Format', namespaces)
-            for fmt in format_elems:
-                if fmt.text:
-                    formats.append(fmt.text)
-                    
-            info_formats = []
-            info_format_elems = root.findall('.//wms:GetFeatureInfo/wms:Format', namespaces)
-            for fmt in info_format_elems:
-                if fmt.text:
-                    info_formats.append(fmt.text)
-                    
-            # Layers
-            layers = []
-            layer_elems = root.findall('.//wms:Layer', namespaces)
-            for layer_elem in layer_elems:
-                name_elem = layer_elem.find('wms:Name', namespaces)
-                if name_elem is not None and name_elem.text:
-                    layer = self._parse_layer(layer_elem, namespaces)
-                    layers.append(layer)
+        async with self._request_slots:
+            async with self._http.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304 and (etag or last_modified):
+                    return None, etag, last_modified
+                response.raise_for_status()
+                
+                # Parsing is CPU-bound, so it runs off the event loop. An lxml
+                # parser must stay on the thread that created it, hence the
+                # dedicated single-thread executor rather than asyncio.to_thread
+                loop = asyncio.get_running_loop()
+                try:
+                    parser = await loop.run_in_executor(
+                        _PARSE_EXECUTOR, _CapabilitiesParser, version, self._parse_layer
+                    )
+                    async for chunk in response.aiter_bytes(65536):
+                        await loop.run_in_executor(_PARSE_EXECUTOR, parser.feed, chunk)
+                    capabilities = await loop.run_in_executor(_PARSE_EXECUTOR, parser.close)
+                except Exception as e:
+                    logger.error(f"Error parsing capabilities: {e}")
+                    raise
                     
-            return {
-                "title": title,
-                "abstract": abstract,
-                "version": version,
-                "layers": layers,
-                "formats": formats,
-                "info_formats": info_formats,
-                "cached_at": datetime.now().isoformat()
-            }
-            
-        except Exception as e:
-            logger.error(f"Error parsing capabilities: {e}")
-            raise
+                return (
+                    capabilities,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified")
+                )
         
-    def _parse_layer(self, layer_elem, namespaces: Dict[str, str]) -> dict:
-        """Parse a single layer from capabilities XML"""
-        name_elem = layer_elem.find('wms:Name', namespaces)
-        name = name_elem.text if name_elem is not None else ""
+    def _parse_layer(self, layer_elem) -> Optional[dict]:
+        """Parse a single layer from capabilities XML, or None if it has no name"""
+        name_elem = _first(_XP_NAME, layer_elem)
+        if name_elem is None or not name_elem.text:
+            return None
+        name = name_elem.text
         
-        title_elem = layer_elem.find('wms:Title', namespaces)
+        title_elem = _first(_XP_TITLE, layer_elem)
         title = title_elem.text if title_elem is not None else name
         
-        abstract_elem = layer_elem.find('wms:Abstract', namespaces)
+        abstract_elem = _first(_XP_ABSTRACT, layer_elem)
         abstract = abstract_elem.text if abstract_elem is not None else None
         
-        # CRS support
+        # CRS support - layers repeat the same few CRS codes, so dedupe them
+        # and intern the strings to share one copy across all layers
         crs_list = []
-        crs_elems = layer_elem.findall('wms:CRS', namespaces)
-        for crs_elem in crs_elems:
-            if crs_elem.text:
-                crs_list.append(crs_elem.text)
+        seen = set()
+        for crs_elem in _XP_CRS(layer_elem):
+            crs = crs_elem.text
+            if crs and crs not in seen:
+                seen.add(crs)
+                crs_list.append(sys.intern(crs))
                 
         # Queryable attribute
         queryable = layer_elem.get('queryable', '0') == '1'
@@ -145,11 +474,11 @@ class WMSClient:
             "name": name,
             "title": title,
             "abstract": abstract,
-            "crs_list": crs_list,
+            "crs_list": tuple(crs_list),
             "queryable": queryable
         }
         
-    async def get_map(
+    def get_map(
         self,
         layers: Union[str, List[str]],
         bbox: BoundingBox,
@@ -168,27 +497,18 @@ class WMSClient:
         if crs is None:
             crs = bbox.crs
             
-        params = {
-            "service": "WMS",
-            "request": "GetMap",
-            "version": version,
-            "layers": layers,
-            "width": width,
-            "height": height,
-            "format": format,
-            "transparent": str(transparent).lower(),
-            "bgcolor": bgcolor
-        }
-        
-        # Handle different parameter names for different versions
-        if version == "1.3.0":
-            params["crs"] = crs
-            params["bbox"] = f"{bbox.min_x},{bbox.min_y},{bbox.max_x},{bbox.max_y}"
-        else:
-            params["srs"] = crs
-            params["bbox"] = f"{bbox.min_x},{bbox.min_y},{bbox.max_x},{bbox.max_y}"
-            
-        return f"{self.base_url}?{urllib.parse.urlencode(params)}"
+        return _build_get_map_url(
+            self.base_url,
+            layers,
+            f"{bbox.min_x},{bbox.min_y},{bbox.max_x},{bbox.max_y}",
+            width,
+            height,
+            format,
+            version,
+            crs,
+            transparent,
+            bgcolor
+        )
         
     async def get_feature_info(
         self,
@@ -210,38 +530,29 @@ class WMSClient:
         if crs is None:
             crs = bbox.crs
             
-        params = {
-            "service": "WMS",
-            "request": "GetFeatureInfo",
-            "version": version,
-            "layers": layers,
-            "query_layers": layers,
-            "width": width,
-            "height": height,
-            "info_format": info_format,
-            "feature_count": feature_count,
-            "x": x,
-            "y": y
-        }
-        
-        # Handle different parameter names for different versions
-        if version == "1.3.0":
-            params["crs"] = crs
-            params["bbox"] = f"{bbox.min_x},{bbox.min_y},{bbox.max_x},{bbox.max_y}"
-        else:
-            params["srs"] = crs
-            params["bbox"] = f"{bbox.min_x},{bbox.min_y},{bbox.max_x},{bbox.max_y}"
-            
-        url = f"{self.base_url}?{urllib.parse.urlencode(params)}"
+        url = _build_get_feature_info_url(
+            self.base_url,
+            layers,
+            f"{bbox.min_x},{bbox.min_y},{bbox.max_x},{bbox.max_y}",
+            x,
+            y,
+            width,
+            height,
+            info_format,
+            version,
+            crs,
+            feature_count
+        )
         
         try:
-            with urllib.request.urlopen(url) as response:
-                return response.read().decode('utf-8')
+            response = await self._get(url)
+            response.raise_for_status()
+            return response.content.decode('utf-8')
         except Exception as e:
             logger.error(f"Error getting feature info: {e}")
             raise
         
-    async def convert_coordinates(
+    def convert_coordinates(
         self, 
         x: float, 
         y: float, 
@@ -254,41 +565,33 @@ class WMSClient:
         if source_crs == target_crs:
             return x, y
             
-        # Basic conversion between common CRS
-        if source_crs == "EPSG:4326" and target_crs == "EPSG:27700":
-            # Very rough WGS84 to BNG conversion (for demo purposes only)
-            # In production, use proper transformation libraries
-            return x * 111319.9, y * 111319.9
-        elif source_crs == "EPSG:27700" and target_crs == "EPSG:4326":
-            # Very rough BNG to WGS84 conversion (for demo purposes only)
-            return x / 111319.9, y / 111319.9
-        else:
+        transform = _CRS_TRANSFORMS.get((source_crs, target_crs))
+        if transform is None:
             # Return as-is for other CRS combinations
             logger.warning(f"No conversion available from {source_crs} to {target_crs}")
             return x, y
+            
+        return transform(x, y)
         
-    async def get_layer_by_name(self, name: str) -> Optional[dict]:
+    async def get_layer_by_name(self, name: str, version: str = "1.3.0") -> Optional[dict]:
         """Get layer information by name"""
-        capabilities = await self.get_capabilities()
-        for layer in capabilities.get('layers', []):
-            if layer.get('name') == name:
-                return layer
-        return None
+        await self.get_capabilities(version=version)
+        return self._layer_index[version].get(name)
         
-    async def search_layers(self, query: str) -> List[dict]:
+    async def get_layers_by_name(
+        self,
+        names: Optional[List[str]] = None,
+        version: str = "1.3.0"
+    ) -> Dict[str, Optional[dict]]:
+        """Get information for several layers (all layers if names is None)"""
+        await self.get_capabilities(version=version)
+        index = self._layer_index[version]
+        if names is None:
+            return dict(index)
+        return {name: index.get(name) for name in names}
+        
+    async def search_layers(self, query: str, version: str = "1.3.0") -> List[dict]:
         """Search for layers by name or title"""
-        capabilities = await self.get_capabilities()
+        await self.get_capabilities(version=version)
         query_lower = query.lower()
-        
-        matching_layers = []
-        for layer in capabilities.get('layers', []):
-            name = layer.get('name', '').lower()
-            title = layer.get('title', '').lower()
-            abstract = layer.get('abstract', '').lower() if layer.get('abstract') else ''
-            
-            if (query_lower in name or 
-                query_lower in title or
-                query_lower in abstract):
-                matching_layers.append(layer)
-                
-        return matching_layers
\ No newline at end of file
+        return [layer for blob, layer in self._search_index[version] if query_lower in blob]
\ No newline at end of file